@@ -1,17 +1,24 @@
 import argparse
+import functools
 import inspect
 import json
+import operator
+import sys
 
 from abc import ABC
-from collections.abc import Mapping
+from collections.abc import KeysView, Mapping
 from io import IOBase
 from pathlib import Path
-from types import UnionType
+from types import MappingProxyType, UnionType
 from typing import (
     Any,
     Callable,
     ClassVar,
+    Iterable,
+    Iterator,
+    NamedTuple,
     Sequence,
+    TYPE_CHECKING,
     Type,
     Literal,
     Union,
@@ -21,13 +28,12 @@ from typing import (
 from typing_extensions import Self
 
 import pydantic
-import pydantic_yaml
-from rich.console import Console
-from rich.pretty import pprint
 
-from .yaml_utils import RUAMEL_YAML, YAML, yaml
-from . import utils, printers
+from .yaml_utils import load_yaml_file
+from . import utils, yaml_utils
 
+if TYPE_CHECKING:
+    from ccorp.ruamel.yaml.include import YAML
 
 DIFF_PRINT_MODE = Literal["none", "tree", "tree_dim", "tree_skip"]
 
@@ -54,6 +60,32 @@ class ConfigBase(pydantic.BaseModel, Mapping, ABC):
         promoting clear and logical configuration setups.
     """
 
+    _expedantic_exclusive_getters: ClassVar[
+        tuple[tuple[set[str], tuple[Callable[[Any], Any], ...]], ...]
+    ] = ()
+    _expedantic_field_names: ClassVar[tuple[str, ...]] = ()
+    _expedantic_field_keys: ClassVar[KeysView[str]] = MappingProxyType({}).keys()
+    _expedantic_argspec: ClassVar[dict[str, "FieldSpec"] | None] = None
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+
+        exclusive_sets = cls.__private_attributes__[
+            "_mutually_exclusive_sets"
+        ].get_default()
+        cls._expedantic_exclusive_getters = tuple(
+            (exclusive_set, tuple(map(operator.attrgetter, exclusive_set)))
+            for exclusive_set in exclusive_sets
+        )
+        cls._expedantic_field_names = tuple(cls.model_fields)
+        cls._expedantic_field_keys = MappingProxyType(
+            dict.fromkeys(cls._expedantic_field_names)
+        ).keys()
+        cls._expedantic_argspec = (
+            _build_argspec(cls) if cls.__pydantic_complete__ else None
+        )
+
     def flatten(self, sep="."):
         """
         Flattens the configuration object's hierarchy into a single-level dictionary, using a
@@ -78,9 +110,14 @@ class ConfigBase(pydantic.BaseModel, Mapping, ABC):
         The method does not modify the original configuration object but returns a new dictionary
         with the flattened structure.
         """
+        flat: dict[str, Any] = {}
+        if _flatten_plain_fields(self, "", sep, flat):
+            return flat
         return utils.flatten_dict(self.model_dump(), sep=sep)
 
-    def compatible_args(self, cls: Type | Callable, *exclusive_keys: str):
+    def compatible_args(
+        self, cls: Type | Callable, *exclusive_keys: str, deep: bool = False
+    ):
         """
         Returns a dictionary of arguments from this config instance that match the signature of `cls`,
         excluding any specified in `exclusive_keys`. This method is useful for dynamically initialising
@@ -89,6 +126,9 @@ class ConfigBase(pydantic.BaseModel, Mapping, ABC):
         Parameters:
         - cls (Type | Callable): Class or callable to filter compatible configuration arguments for.
         - exclusive_keys (str): Names of keys to exclude from the result.
+        - deep (bool, optional): If True, values are taken from `model_dump()`, so nested configs
+        are returned as dictionaries. Otherwise the field values are returned as they are stored
+        on the instance, without serialising the whole config. Defaults to False.
 
         Returns:
         Dictionary of compatible arguments, excluding those listed in `exclusive_keys`.
@@ -97,11 +137,13 @@ class ConfigBase(pydantic.BaseModel, Mapping, ABC):
         Given a configuration with attributes 'a', 'b', 'c', and a function requiring 'a' and 'b',
         calling `self.compatible_args(target_function, 'c')` yields {'a': value, 'b': value}.
         """
-        fields = self.model_dump()
-        args = utils.get_kwargs(cls)
-        arg_keys = set(args.keys())
-        arg_keys -= set(exclusive_keys)
-        return {k: v for k, v in fields.items() if k in arg_keys}
+        arg_keys = utils.get_kwargs(cls).keys() - set(exclusive_keys)
+        if deep:
+            fields = self.model_dump()
+            return {k: v for k, v in fields.items() if k in arg_keys}
+
+        values = self.__dict__
+        return {k: values[k] for k in type(self).model_fields if k in arg_keys}
 
     def save_as_yaml(
         self,
@@ -111,7 +153,7 @@ class ConfigBase(pydantic.BaseModel, Mapping, ABC):
         map_indent: int | None = None,
         sequence_indent: int | None = None,
         sequence_dash_offset: int | None = None,
-        custom_yaml_writer: YAML | None = yaml,
+        custom_yaml_writer: "YAML | None" = utils._NOT_PROVIDED,
         **json_kwargs,
     ):
         """Write a YAML file representation of the model.
@@ -131,34 +173,64 @@ class ConfigBase(pydantic.BaseModel, Mapping, ABC):
             More specific indent values.
         custom_yaml_writer : None or YAML
             An instance of ruamel.yaml.YAML (or a subclass) to use as the writer.
-            The above options will be set on it, if given.
+            The above options will be set on it, if given. Defaults to the package's
+            `!include`-aware writer; None selects ruamel's safe writer.
         json_kwargs : Any
-            Keyword arguments to pass `model.json()`.
+            Keyword arguments to pass `model_dump()`.
 
         Notes
         -----
-        This currently uses JSON dumping as an intermediary.
-        This means that you can use `json_encoders` in your model.
+        The model is dumped in JSON mode and handed to the writer directly, without a JSON
+        string round trip.
         """
-        pydantic_yaml.to_yaml_file(
-            file,
-            self,
-            default_flow_style=default_flow_style,
-            indent=indent,
-            map_indent=map_indent,
-            sequence_indent=sequence_indent,
-            sequence_dash_offset=sequence_dash_offset,
-            custom_yaml_writer=custom_yaml_writer,
-            **json_kwargs,
+        data = self.model_dump(mode="json", **json_kwargs)
+
+        if custom_yaml_writer is utils._NOT_PROVIDED:
+            writer = yaml_utils.yaml
+        elif custom_yaml_writer is None:
+            writer = yaml_utils.RUAMEL_YAML(typ="safe")
+        elif isinstance(custom_yaml_writer, yaml_utils.RUAMEL_YAML):
+            writer = custom_yaml_writer
+        else:
+            raise TypeError(
+                f"Please pass a YAML instance or subclass. Got {custom_yaml_writer!r}"
+            )
+        if default_flow_style is not None:
+            writer.default_flow_style = default_flow_style
+        writer.indent(mapping=indent, sequence=indent, offset=indent)
+        writer.indent(
+            mapping=map_indent, sequence=sequence_indent, offset=sequence_dash_offset
         )
 
+        if isinstance(file, IOBase):
+            writer.dump(data, file)
+        elif isinstance(file, (str, Path)):
+            with Path(file).resolve().open("w") as f:
+                writer.dump(data, f)
+        else:
+            raise TypeError(f"Expected Path, str, or stream, but got {file!r}")
+
     @classmethod
     def generate_schema(cls, path: str | Path):
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        json.dump(cls.model_json_schema(), path.open("w"), indent=2)
+        schema = _schema_for(cls)
+        try:
+            import orjson
+        except ImportError:
+            path.write_text(json.dumps(schema, indent=2))
+        else:
+            path.write_bytes(orjson.dumps(schema, option=orjson.OPT_INDENT_2))
         print(f"JSON Schema for {cls.__name__} is generated at {path}")
 
+    @staticmethod
+    def expedantic_invalidate_schema_cache():
+        """
+        Clears the JSON schemas cached by `generate_schema`. Call this after `model_rebuild` or
+        any other change that alters a config class's schema.
+        """
+        _schema_for.cache_clear()
+
     @classmethod
     def load_from_yaml(
         cls,
@@ -166,19 +238,71 @@ class ConfigBase(pydantic.BaseModel, Mapping, ABC):
         *,
         diff_print_mode: DIFF_PRINT_MODE = "tree",
         print_config: bool = True,
+        trusted: bool = False,
     ):
-        path = Path(path)
-        try:
-            instance = pydantic_yaml.parse_yaml_file_as(cls, path)
-        except pydantic.ValidationError as e:
-            printers.print_validation_errors(cls, e)
-            exit(1)
+        """
+        Loads an instance of the class from a YAML file.
+
+        Parameters:
+        - path (Path | str): Path to the YAML file. `!include` directives are resolved.
+        - diff_print_mode: Printing mode for displaying the differences to the defaults. See
+        `parse_args` for the available modes.
+        - print_config (bool, optional): Whether to pretty-print the loaded config. Defaults to True.
+        - trusted (bool, optional): If True, the instance is built with `model_construct` and
+        validation is skipped entirely. Defaults to False.
+
+        Returns:
+        An instance of the class initialised with the values from the file.
+
+        Warning:
+        `trusted=True` bypasses every validator, including type coercion, field constraints and
+        `_mutually_exclusive_sets`. Only use it for files produced by `save_as_yaml` from the same
+        schema (e.g. checkpoint reloads); malformed input will silently produce an invalid config.
+        Configs with fields whose saved form differs from their type (e.g. unions, optionals or
+        paths) are still validated, as their values could not be used as they are.
+        """
+        data = load_yaml_file(path) or {}
+        if trusted:
+            instance = cls._construct_recursively(data)
+        else:
+            try:
+                instance = cls.model_validate(data)
+            except pydantic.ValidationError as e:
+                from . import printers
 
-        cls.print_diff_to_default(instance.model_dump(), diff_print_mode)
+                printers.print_validation_errors(cls, e)
+                exit(1)
+
+        if "tree" in diff_print_mode:
+            cls.print_diff_to_default(instance.model_dump(), diff_print_mode)
 
         if print_config:
+            from rich.pretty import pprint
+
             pprint(instance)
 
+        return instance
+
+    @classmethod
+    def _construct_recursively(cls, data: dict[str, Any]) -> Self:
+        """
+        `model_construct` counterpart that also constructs nested `ConfigBase` fields from their
+        dictionaries, as `model_construct` itself leaves nested values untouched. Falls back to
+        `model_validate` for configs with a field `_construct_spec` cannot take as loaded.
+        """
+        nested = _construct_spec(cls)
+        if nested is None:
+            return cls.model_validate(data)
+
+        values = dict(data)
+        for name in nested:
+            value = values.get(name)
+            if isinstance(value, dict):
+                values[name] = cls.model_fields[name].annotation._construct_recursively(
+                    value
+                )
+        return cls.model_construct(**values)
+
     @classmethod
     def parse_args(
         cls,
@@ -217,129 +341,141 @@ class ConfigBase(pydantic.BaseModel, Mapping, ABC):
         names. It handles various data types appropriately and allows for the specification of default
         values directly in the command line invocation or through a configuration file.
         """
-        console = Console()
-
-        def _parse_params(
-            parser: argparse.ArgumentParser,
-            cls: Type[ConfigBase],
-            parent_key: str = "",
-            sep=sep,
-        ):
-            for name, field_info in cls.model_fields.items():
-                if parent_key:
-                    name = f"{parent_key}{sep}{name}"
-
-                tp = field_info.annotation
-                assert tp is not None
-                origin = get_origin(tp)
-
-                if not origin and inspect.isclass(tp) and issubclass(tp, ConfigBase):
-                    _parse_params(parser, tp, name, sep)
-                    continue
-
-                if replace_underscore_to_hyphen:
-                    name = name.replace("_", "-")
-
-                names = [f"--{name}"]
-                kwargs = {}
-                kwargs["type"] = tp
-
-                annot_repr = str(tp) if origin else tp.__name__
-
-                if tp is Any:
-                    kwargs["type"] = str
-                elif tp is bool:
-                    kwargs["action"] = argparse.BooleanOptionalAction
-                elif origin is Literal:
-                    var_type, literals = utils.get_literals(tp, name)
-                    kwargs["type"] = var_type
-                    kwargs["choices"] = literals
-                    annot_repr = annot_repr.replace("typing.", "")
-                elif origin in {list, set, tuple}:
-                    kwargs["nargs"] = "*"
-                    args = get_args(tp)
-                    if len(args) == 0:
-                        kwargs["type"] = str
-                    else:
-                        kwargs["type"] = args[0]
-                elif origin in {UnionType, Union}:
-                    kwargs["type"] = (
-                        str  # Try to solve union types via pydantic internal.
-                    )
-                    if origin is Union:
-                        args: tuple[type, ...] = get_args(tp)
-                        annot_repr = " | ".join(map(lambda a: a.__name__, args))
-                elif origin is dict:
-                    kwargs["type"] = YAML().load
-
-                if field_info.is_required():
-                    req_repr = "required"
-                    if not require_default_file:
-                        kwargs["default"] = utils._NOT_PROVIDED
-                else:
-                    default_value = field_info.get_default(call_default_factory=True)
-                    req_repr = f"default: {default_value}"
-                    if not require_default_file:
-                        kwargs["default"] = default_value
-
-                help = field_info.description + " " if field_info.description else ""
-                kwargs["help"] = help + f"({annot_repr}, {req_repr})"
-
-                if require_default_file:
-                    kwargs["default"] = utils._NOT_PROVIDED
-
-                parser.add_argument(*names, **kwargs)
-
-        parser = utils.ArgumentParser(add_help=False, usage=argparse.SUPPRESS)
-        if require_default_file:
-            parser.add_argument(
-                "_config_file_path", type=Path, help="Default Config File Path"
-            )
-        parser.add_argument("--help", "-h", action="store_true")
-        _parse_params(parser, cls)
+        parser, keypaths = _build_parser(
+            cls, require_default_file, replace_underscore_to_hyphen, sep
+        )
         parsed_dict = parser.parse_all_args_as_dict(args)
 
         if parsed_dict["help"]:
-            printers.help.print_help(cls, replace_underscore_to_hyphen, sep, console)
+            from . import printers
+
+            printers.help.print_help(cls, replace_underscore_to_hyphen, sep)
             exit(0)
         del parsed_dict["help"]
 
         if require_default_file:
-            with open(parsed_dict["_config_file_path"], "r") as f:
-                file_dict = YAML().load(f)
-            del parsed_dict["_config_file_path"]
+            file_dict = _load_default_file(parsed_dict.pop("_config_file_path"))
         else:
             file_dict = {}
 
-        nested_args_dict = {}
-        for k, v in parsed_dict.items():
-            if v is utils._NOT_PROVIDED:
-                continue
-            keys = k.split(sep)
-            current_level = nested_args_dict
-            for key in keys[:-1]:
-                current_level = current_level.setdefault(key, {})
-            current_level[keys[-1]] = v
+        parsed_args = (
+            (keypaths.get(k) or k.split(sep), v)
+            for k, v in parsed_dict.items()
+            if v is not utils._NOT_PROVIDED
+        )
+        return cls._validate_parsed_args(
+            file_dict,
+            parsed_args,
+            diff_print_mode,
+            print_config,
+            fill_defaults=not require_default_file,
+        )
 
-        def update_recursively(d: dict, other: dict):
-            for k, v in other.items():
-                if isinstance(v, dict):
-                    d[k] = update_recursively(d.get(k, {}), v)
-                else:
-                    d[k] = v
-            return d
+    @classmethod
+    def fast_parse_args(
+        cls,
+        *,
+        require_default_file: bool = False,
+        replace_underscore_to_hyphen: bool = False,
+        diff_print_mode: DIFF_PRINT_MODE = "tree",
+        print_config: bool = True,
+        args: Sequence[str] | None = None,
+        sep=".",
+    ):
+        """
+        Drop-in alternative to `parse_args` that skips argparse. The command line is scanned once
+        against a flag table precomputed per class.
+
+        The parameters and the return value are the same as for `parse_args`. `--help` / `-h` is
+        still handled by `parse_args`.
+
+        Supported syntax: `--key value`, `--key=value`, `--key v1 v2 ...` for list, set and tuple
+        fields, and `--flag` / `--no-flag` for booleans. Unique prefixes of option names are
+        accepted, as with argparse. Unknown options are kept (as strings, or
+        True without a value) so that validation reports them.
+        """
+        args = sys.argv[1:] if args is None else list(args)
+        if "--help" in args or "-h" in args:
+            return cls.parse_args(
+                require_default_file=require_default_file,
+                replace_underscore_to_hyphen=replace_underscore_to_hyphen,
+                diff_print_mode=diff_print_mode,
+                print_config=print_config,
+                args=args,
+                sep=sep,
+            )
 
-        file_dict = update_recursively(file_dict, nested_args_dict)
+        flag_map = _build_flag_map(cls, replace_underscore_to_hyphen, sep)
+        positionals, parsed_args = _scan_args(args, flag_map, sep)
+
+        if len(positionals) != int(require_default_file):
+            extra = positionals[int(require_default_file) :]
+            if extra:
+                message = f"unrecognized arguments: {' '.join(extra)}"
+            else:
+                message = "the following arguments are required: _config_file_path"
+            print(f"error: {message}", file=sys.stderr)
+            exit(2)
+
+        file_dict = _load_default_file(positionals[0]) if require_default_file else {}
+        return cls._validate_parsed_args(
+            file_dict,
+            parsed_args,
+            diff_print_mode,
+            print_config,
+            fill_defaults=not require_default_file,
+        )
+
+    @classmethod
+    def _validate_parsed_args(
+        cls,
+        file_dict: dict[str, Any],
+        parsed_args: Iterable[tuple[Sequence[str], Any]],
+        diff_print_mode: DIFF_PRINT_MODE,
+        print_config: bool,
+        fill_defaults: bool = False,
+    ):
+        # Command-line values are written straight into the file's dict, creating (or replacing
+        # non-dict) intermediate levels on the way.
+        for keys, v in parsed_args:
+            current_level = file_dict
+            for key in keys[:-1]:
+                next_level = current_level.get(key)
+                if not isinstance(next_level, dict):
+                    next_level = current_level[key] = {}
+                current_level = next_level
+            last_key = keys[-1]
+            if isinstance(v, dict) and isinstance(current_level.get(last_key), dict):
+                utils.merge_dicts_in_place(current_level[last_key], v)
+            else:
+                current_level[last_key] = v
+
+        if fill_defaults:
+            # Omitted options get their defaults as input, so that pydantic coerces them like any
+            # other value (e.g. a `Path` field declared with a str default).
+            for keys, v in _iter_arg_defaults(cls):
+                current_level = file_dict
+                for key in keys[:-1]:
+                    current_level = current_level.setdefault(key, {})
+                    if not isinstance(current_level, dict):
+                        break
+                else:
+                    current_level.setdefault(keys[-1], v)
 
         try:
             instance = cls.model_validate(file_dict)
         except pydantic.ValidationError as e:
+            from . import printers
+
             printers.print_validation_errors(cls, e)
             exit(1)
 
-        cls.print_diff_to_default(instance.model_dump(), diff_print_mode)
+        if "tree" in diff_print_mode:
+            cls.print_diff_to_default(instance.model_dump(), diff_print_mode)
 
         if print_config:
+            from rich.pretty import pprint
+
             pprint(instance)
 
         return instance
@@ -349,6 +485,8 @@ class ConfigBase(pydantic.BaseModel, Mapping, ABC):
         cls, incoming: dict[str, Any], diff_print_mode: DIFF_PRINT_MODE
     ):
         if "tree" in diff_print_mode:
+            from . import printers
+
             default_dict = utils.get_default_dict(cls, utils._NOT_PROVIDED)
             dim_unchanged, skip_unchanged = (
                 diff_print_mode == "tree_dim",
@@ -364,24 +502,30 @@ class ConfigBase(pydantic.BaseModel, Mapping, ABC):
 
     @pydantic.model_validator(mode="after")
     def check_mutually_exclusive_sets(self) -> Self:
-        for exclusive_set in self._mutually_exclusive_sets:
-            check = sum(bool(self[key]) for key in exclusive_set) == 1
-            if not check:
+        for exclusive_set, getters in type(self)._expedantic_exclusive_getters:
+            count = 0
+            for getter in getters:
+                if getter(self):
+                    count += 1
+                    if count > 1:
+                        break
+            if count != 1:
                 raise ValueError(
                     f"Mutual exclusivity has broken. (set: {exclusive_set})"
                 )
         return self
 
     def __getitem__(self, key: str):
-        if key not in self.model_fields:
-            raise KeyError(f"Key '{key}' not found.")
-        return self.__getattribute__(key)
+        try:
+            return self.__dict__[key]
+        except KeyError:
+            raise KeyError(f"Key '{key}' not found.") from None
 
     def __len__(self):
-        return len(self.model_fields)
+        return len(type(self)._expedantic_field_names)
 
     def keys(self):
-        return self.model_fields.keys()
+        return type(self)._expedantic_field_keys
 
     # _expedantic_root: ClassVar[bool] = True
 
@@ -411,3 +555,425 @@ class ConfigBase(pydantic.BaseModel, Mapping, ABC):
     #             printers.print_validation_errors(cls, e)
     #             exit(1)
     #         raise
+
+
+FieldSpec = tuple[Any, ...]
+"""
+Normalised argparse-relevant description of a field's annotation. The first element names the
+kind of the field and the rest carries its payload:
+`("submodel", cls)`, `("any",)`, `("bool",)`, `("literal", tp)`, `("seq", element_type)`,
+`("union", args)`, `("dict",)` or `("scalar", tp)`.
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def _seq_element_type(tp: Any) -> Any:
+    args = get_args(tp)
+    return args[0] if args else str
+
+
+def _build_field_spec(tp: Any) -> FieldSpec:
+    origin = get_origin(tp)
+
+    if not origin and inspect.isclass(tp) and issubclass(tp, ConfigBase):
+        return ("submodel", tp)
+    if tp is Any:
+        return ("any",)
+    if tp is bool:
+        return ("bool",)
+    if origin is Literal:
+        # Literal values are resolved lazily so that an unsupported Literal only fails when
+        # the argument parser is actually built.
+        return ("literal", tp)
+    if origin in {list, set, tuple}:
+        return ("seq", _seq_element_type(tp))
+    if origin in {UnionType, Union}:
+        return ("union", get_args(tp))
+    if origin is dict:
+        return ("dict",)
+    return ("scalar", tp)
+
+
+def _build_argspec(cls: Type[ConfigBase]) -> dict[str, FieldSpec]:
+    argspec = {}
+    for name, field_info in cls.model_fields.items():
+        assert field_info.annotation is not None
+        argspec[name] = _build_field_spec(field_info.annotation)
+    return argspec
+
+
+def _get_argspec(cls: Type[ConfigBase]) -> dict[str, FieldSpec]:
+    argspec = cls._expedantic_argspec
+    if argspec is None:
+        # Not built at class creation (the class itself, or a model with unresolved
+        # annotations at that time).
+        argspec = cls._expedantic_argspec = _build_argspec(cls)
+    return argspec
+
+
+_PLAIN_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_loaded_as_is(tp: Any) -> bool:
+    """
+    Whether values of the annotation `tp`, as dumped by `save_as_yaml` and loaded back, already
+    have the type validation would give them.
+    """
+    if tp in _PLAIN_TYPES or tp is Any:
+        return True
+    origin = get_origin(tp)
+    args = get_args(tp)
+    if origin is Literal:
+        return all(type(arg) in _PLAIN_TYPES for arg in args)
+    if origin is list:
+        return all(map(_is_loaded_as_is, args))
+    if origin is dict:
+        return not args or (args[0] is str and _is_loaded_as_is(args[1]))
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def _construct_spec(cls: Type[ConfigBase]) -> tuple[str, ...] | None:
+    """
+    Returns the names of the nested config fields `_construct_recursively` descends into, or
+    `None` when some other field of `cls` must be validated to get its type (unions, optionals,
+    paths, enums, ...).
+    """
+    nested = []
+    for name, field_info in cls.model_fields.items():
+        tp = field_info.annotation
+        if utils.is_base_model(tp) and issubclass(tp, ConfigBase):
+            nested.append(name)
+        elif not _is_loaded_as_is(tp):
+            return None
+    return tuple(nested)
+
+
+def _has_serialization(schema: Any) -> bool:
+    """
+    Whether any part of the core `schema` carries custom serialisation, e.g. from a
+    `PlainSerializer` or `WrapSerializer` in a field's `Annotated` metadata.
+    """
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if "serialization" in node:
+                return True
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def _flatten_spec(
+    cls: Type[ConfigBase],
+) -> tuple[tuple[str, frozenset[type]], ...] | None:
+    """
+    Pairs each field of `cls` with the config classes its value may be descended into without
+    serialising it, or returns `None` when `model_dump` may alter the values (serializers,
+    computed or excluded fields, aliases, extra values).
+    """
+    decorators = cls.__pydantic_decorators__
+    if (
+        decorators.field_serializers
+        or decorators.model_serializers
+        or _has_serialization(cls.__pydantic_core_schema__)
+        or cls.model_computed_fields
+        or cls.model_config.get("extra") == "allow"
+        or cls.model_config.get("serialize_by_alias")
+        or any(
+            field.exclude or getattr(field, "exclude_if", None)
+            for field in cls.model_fields.values()
+        )
+    ):
+        return None
+
+    spec = []
+    for name, field_spec in _get_argspec(cls).items():
+        if field_spec[0] == "submodel":
+            submodels = frozenset((field_spec[1],))
+        elif field_spec[0] == "union":
+            submodels = frozenset(
+                arg
+                for arg in field_spec[1]
+                if inspect.isclass(arg) and issubclass(arg, ConfigBase)
+            )
+        else:
+            submodels = frozenset()
+        spec.append((name, submodels))
+    return tuple(spec)
+
+
+def _flatten_plain_fields(
+    config: ConfigBase, prefix: str, sep: str, out: dict[str, Any]
+) -> bool:
+    """
+    Flattens `config` into `out` straight from the instance dictionaries. Returns `False` as soon
+    as a value would need pydantic's serialisation, in which case `out` is left incomplete.
+    """
+    spec = _flatten_spec(type(config))
+    if spec is None:
+        return False
+
+    values = config.__dict__
+    for name, submodels in spec:
+        value = values[name]
+        key = f"{prefix}{sep}{name}" if prefix else name
+        tp = type(value)
+        if tp in _PLAIN_TYPES:
+            out[key] = value
+        elif tp in submodels:
+            if not _flatten_plain_fields(value, key, sep, out):
+                return False
+        elif tp is list and all(type(v) in _PLAIN_TYPES for v in value):
+            out[key] = value.copy()
+        else:
+            return False
+    return True
+
+
+def _set_any_kwargs(kwargs: dict[str, Any], spec: FieldSpec, name: str):
+    kwargs["type"] = str
+
+
+def _set_bool_kwargs(kwargs: dict[str, Any], spec: FieldSpec, name: str):
+    kwargs["action"] = argparse.BooleanOptionalAction
+
+
+def _set_literal_kwargs(kwargs: dict[str, Any], spec: FieldSpec, name: str):
+    var_type, literals = utils.get_literals(spec[1], name)
+    kwargs["type"] = var_type
+    kwargs["choices"] = literals
+
+
+def _set_seq_kwargs(kwargs: dict[str, Any], spec: FieldSpec, name: str):
+    kwargs["nargs"] = "*"
+    kwargs["type"] = spec[1]
+
+
+def _set_union_kwargs(kwargs: dict[str, Any], spec: FieldSpec, name: str):
+    kwargs["type"] = str  # Try to solve union types via pydantic internal.
+
+
+def _set_dict_kwargs(kwargs: dict[str, Any], spec: FieldSpec, name: str):
+    kwargs["type"] = yaml_utils.safe_yaml.load
+
+
+def _set_scalar_kwargs(kwargs: dict[str, Any], spec: FieldSpec, name: str):
+    kwargs["type"] = spec[1]
+
+
+_ARG_KWARGS_SETTERS: dict[str, Callable[[dict[str, Any], FieldSpec, str], None]] = {
+    "any": _set_any_kwargs,
+    "bool": _set_bool_kwargs,
+    "literal": _set_literal_kwargs,
+    "seq": _set_seq_kwargs,
+    "union": _set_union_kwargs,
+    "dict": _set_dict_kwargs,
+    "scalar": _set_scalar_kwargs,
+}
+
+
+def _iter_arg_fields(
+    cls: Type[ConfigBase], parent_path: tuple[str, ...] = ()
+) -> Iterator[tuple[tuple[str, ...], FieldSpec]]:
+    """
+    Yields `(path, spec)` for every command-line settable field of `cls`, descending into
+    nested configs. `path` holds the field names leading to the field.
+    """
+    argspec = _get_argspec(cls)
+    for field_name, spec in argspec.items():
+        path = (*parent_path, field_name)
+        if spec[0] == "submodel":
+            yield from _iter_arg_fields(spec[1], path)
+        else:
+            yield path, spec
+
+
+def _iter_arg_defaults(
+    cls: Type[ConfigBase], parent_path: tuple[str, ...] = ()
+) -> Iterator[tuple[tuple[str, ...], Any]]:
+    """
+    Yields `(path, default)` for every non-required command-line settable field of `cls`, like
+    `_iter_arg_fields`. Defaults are copied and default factories called afresh on each call.
+    """
+    for field_name, spec in _get_argspec(cls).items():
+        path = (*parent_path, field_name)
+        if spec[0] == "submodel":
+            yield from _iter_arg_defaults(spec[1], path)
+        else:
+            field = cls.model_fields[field_name]
+            if not field.is_required():
+                yield path, field.get_default(call_default_factory=True)
+
+
+def _parse_params(
+    parser: argparse.ArgumentParser,
+    cls: Type[ConfigBase],
+    replace_underscore_to_hyphen: bool,
+    keypaths: dict[str, tuple[str, ...]],
+    sep=".",
+):
+    for path, spec in _iter_arg_fields(cls):
+        name = dest = sep.join(path)
+        keypaths[dest] = path
+        if replace_underscore_to_hyphen:
+            name = name.replace("_", "-")
+
+        names = [f"--{name}"]
+        kwargs = {}
+        _ARG_KWARGS_SETTERS[spec[0]](kwargs, spec, name)
+
+        # Defaults of omitted options are resolved per call by `_iter_arg_defaults` instead, so
+        # the cached parser never hands the same mutable default to two instances.
+        kwargs["default"] = utils._NOT_PROVIDED
+        # `--help` is rendered by `printers.help`, never by argparse.
+        kwargs["help"] = argparse.SUPPRESS
+
+        parser.add_argument(*names, dest=dest, **kwargs)
+
+
+class _Flag(NamedTuple):
+    path: tuple[str, ...]
+    type: Callable[[str], Any] | None
+    nargs: int | str
+    const: Any = None
+
+
+@functools.lru_cache(maxsize=256)
+def _build_flag_map(
+    cls: Type[ConfigBase], replace_underscore_to_hyphen: bool, sep: str
+) -> dict[str, _Flag]:
+    flag_map = {}
+    for path, spec in _iter_arg_fields(cls):
+        name = sep.join(path)
+        if replace_underscore_to_hyphen:
+            name = name.replace("_", "-")
+
+        kwargs = {}
+        _ARG_KWARGS_SETTERS[spec[0]](kwargs, spec, name)
+
+        if spec[0] == "bool":
+            flag_map[f"--{name}"] = _Flag(path, None, 0, True)
+            flag_map[f"--no-{name}"] = _Flag(path, None, 0, False)
+        else:
+            flag_map[f"--{name}"] = _Flag(path, kwargs["type"], kwargs.get("nargs", 1))
+    return flag_map
+
+
+def _convert_arg(type_: Callable[[str], Any] | None, value: str) -> Any:
+    if type_ is None:
+        return value
+    try:
+        return type_(value)
+    except (argparse.ArgumentTypeError, TypeError, ValueError):
+        # Same as `utils.ArgumentParser`: leave the string for pydantic to validate.
+        return value
+
+
+def _scan_args(
+    args: Sequence[str], flag_map: dict[str, _Flag], sep: str
+) -> tuple[list[str], list[tuple[Sequence[str], Any]]]:
+    positionals = []
+    parsed_args = {}
+
+    i, n = 0, len(args)
+    while i < n:
+        arg = args[i]
+        i += 1
+        if not arg.startswith("--"):
+            positionals.append(arg)
+            continue
+
+        option, has_value, inline_value = arg.partition("=")
+        flag = flag_map.get(option)
+        if flag is None:
+            # Unique prefixes select an option, as with argparse's `allow_abbrev`.
+            matches = [name for name in flag_map if name.startswith(option)]
+            if len(matches) > 1:
+                print(
+                    f"error: ambiguous option: {arg} could match {', '.join(matches)}",
+                    file=sys.stderr,
+                )
+                exit(2)
+            if matches:
+                option = matches[0]
+                flag = flag_map[option]
+        if flag is None:
+            # Unknown options are kept so that validation can report them, like
+            # `utils.ArgumentParser.parse_all_args_as_dict` does.
+            flag = _Flag(tuple(option[2:].replace("-", "_").split(sep)), str, "?", True)
+
+        if has_value:
+            if flag.nargs == 0:
+                # Boolean flags take no value, as with argparse's BooleanOptionalAction.
+                name = option[5:] if flag.const is False else option[2:]
+                print(
+                    f"error: argument --{name}/--no-{name}: ignored explicit argument "
+                    f"{inline_value!r}",
+                    file=sys.stderr,
+                )
+                exit(2)
+            values = [inline_value]
+        else:
+            start = i
+            if flag.nargs != 0:
+                while i < n and not args[i].startswith("--"):
+                    i += 1
+                    if flag.nargs != "*":
+                        break
+            values = args[start:i]
+
+        if flag.nargs == "*":
+            value = [_convert_arg(flag.type, v) for v in values]
+        elif values:
+            value = _convert_arg(flag.type, values[0])
+        elif flag.nargs == 1:
+            print(f"error: argument {option}: expected one argument", file=sys.stderr)
+            exit(2)
+        else:
+            value = flag.const
+
+        parsed_args[flag.path] = value
+
+    return positionals, list(parsed_args.items())
+
+
+@functools.lru_cache(maxsize=256)
+def _schema_for(cls: Type[ConfigBase]) -> dict[str, Any]:
+    return cls.model_json_schema()
+
+
+def _load_default_file(path: Path | str) -> dict[str, Any]:
+    return load_yaml_file(path) or {}
+
+
+@functools.lru_cache(maxsize=256)
+def _build_parser(
+    cls: Type[ConfigBase],
+    require_default_file: bool,
+    replace_underscore_to_hyphen: bool,
+    sep: str,
+) -> tuple[utils.ArgumentParser, dict[str, tuple[str, ...]]]:
+    """
+    Builds the argument parser for `cls` once per option set, along with a mapping from each
+    argument's destination name to its path of nested field names. Both only depend on the
+    class definition, so repeated `parse_args` calls reuse them instead of re-walking the fields.
+    """
+    parser = utils.ArgumentParser(add_help=False, usage=argparse.SUPPRESS)
+    if require_default_file:
+        parser.add_argument(
+            "_config_file_path", type=Path, help="Default Config File Path"
+        )
+    parser.add_argument("--help", "-h", action="store_true")
+    keypaths: dict[str, tuple[str, ...]] = {}
+    _parse_params(
+        parser,
+        cls,
+        replace_underscore_to_hyphen,
+        keypaths,
+        sep=sep,
+    )
+    return parser, keypaths
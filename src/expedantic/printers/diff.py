@@ -1,4 +1,5 @@
-from typing import Any, Literal, get_origin
+import functools
+from typing import Any, Literal
 from rich.columns import Columns
 from rich.console import Console
 from rich.panel import Panel
@@ -8,17 +9,16 @@ from rich.tree import Tree
 
 from ..utils import _NOT_PROVIDED
 
-
 DIFF_STYLE_MAP: dict[
     Literal["previous", "current", "removed", "added", "unchanged", "modified"],
     Style | str,
 ] = {
-    "previous": "deep_pink2",
-    "current": "turquoise2",
-    "removed": "red",
-    "added": "blue",
-    "unchanged": "yellow",
-    "modified": "yellow bold",
+    "previous": Style.parse("deep_pink2"),
+    "current": Style.parse("turquoise2"),
+    "removed": Style.parse("red"),
+    "added": Style.parse("blue"),
+    "unchanged": Style.parse("yellow"),
+    "modified": Style.parse("yellow bold"),
 }
 
 
@@ -31,6 +31,16 @@ TYPE_STYLE_MAP: dict[type | tuple[type, ...], Style] = {
 }
 
 NONE_STYLE = Style(color="bright_cyan")
+DEFAULT_STYLE = Style.parse("default")
+BOLD_STYLE = Style.parse("bold")
+DIM_STYLE = Style.parse("dim")
+
+# Exact-type lookup for the common cases; subclasses fall back to the isinstance scan.
+_EXACT_TYPE_STYLE_MAP: dict[type, Style] = {
+    tp: style
+    for tps, style in TYPE_STYLE_MAP.items()
+    for tp in (tps if isinstance(tps, tuple) else (tps,))
+}
 
 
 def get_value_style(value: Any) -> Style:
@@ -38,11 +48,15 @@ def get_value_style(value: Any) -> Style:
     if value is None:
         return NONE_STYLE
 
+    style = _EXACT_TYPE_STYLE_MAP.get(type(value))
+    if style is not None:
+        return style
+
     for tp, style in TYPE_STYLE_MAP.items():
         if isinstance(value, tp):
             return style
 
-    return Style.parse("default")
+    return DEFAULT_STYLE
 
 
 def create_diff_tree(
@@ -67,48 +81,55 @@ def create_diff_tree(
     def format_value(v: Any) -> str:
         if isinstance(v, (dict, list)):
             return ""
-        if get_origin(v) is Literal:
-            ...
-        return f": {repr(v)}"
+        return f": {v!r}"
 
     def create_value_text(
-        key: str, value: Any, style_override: str | None = None
+        key: str, value: Any, style_override: Style | str | None = None
     ) -> Text:
         value_str = format_value(value)
-        key_style = style_override or "default"
+        key_style = style_override or DEFAULT_STYLE
         value_style = style_override or get_value_style(value)
 
+        text = Text(key, style=key_style)
         if value_str:
-            return Text.assemble((key, key_style), (value_str, value_style))
-        return Text(key, style=key_style)
-
-    def add_dict_to_tree(
-        d: dict[str, Any],
-        tree: Tree,
-        other_dict: dict[str, Any] | None = None,
-        style: str | None = None,
+            text.append(value_str, style=value_style)
+        return text
+
+    def add_value_to_tree(
+        value: Any, tree: Tree, style: Style | str | None = None
     ) -> None:
-        for key, value in sorted(d.items()):
-            if other_dict is None or key not in other_dict:
-                label = create_value_text(key, value, style)
-                node = tree.add(label)
-                if isinstance(value, dict):
-                    add_dict_to_tree(value, node, style=style)
-                elif isinstance(value, list):
-                    add_list_to_tree(value, node, style=style)
-
-    def add_list_to_tree(lst: list, tree: Tree, style: str | None = None) -> None:
-        for i, value in enumerate(lst):
-            if isinstance(value, dict):
-                node = tree.add(Text(f"[{i}]", style=style))
-                add_dict_to_tree(value, node, style=style)
+        """Adds a removed or added `value` under `tree`, descending into dicts and lists.
+
+        Dict items keep their insertion order.
+        """
+        if not isinstance(value, (dict, list)):
+            tree.add(create_value_text("value", value, style))
+            return
+
+        # Children are added to their parent node in order as soon as it is visited, so the
+        # order in which nested containers are visited does not affect the resulting tree.
+        stack = [(tree, value)]
+        while stack:
+            node, container = stack.pop()
+            add = node.add
+            if isinstance(container, dict):
+                for key, v in container.items():
+                    child = add(create_value_text(key, v, style))
+                    if isinstance(v, (dict, list)):
+                        stack.append((child, v))
             else:
-                tree.add(Text(f"[{i}] {repr(value)}", style=style))
+                for i, v in enumerate(container):
+                    if isinstance(v, dict):
+                        stack.append((add(Text(f"[{i}]", style=style)), v))
+                    else:
+                        add(Text(f"[{i}] {v!r}", style=style))
 
     def compare_values(key: str, v1: Any, v2: Any, tree: Tree) -> None:
         if isinstance(v2, dict):
             if isinstance(v1, dict):
-                node = tree.add(Text(key, style="bold"))
+                if skip_unchanged and (v1 is v2 or v1 == v2):
+                    return
+                node = tree.add(Text(key, style=BOLD_STYLE))
                 create_diff_tree(
                     v1,
                     v2,
@@ -117,7 +138,7 @@ def create_diff_tree(
                     skip_unchanged=skip_unchanged,
                 )
             elif v1 is _NOT_PROVIDED:
-                node = tree.add(Text(key, style="bold"))
+                node = tree.add(Text(key, style=BOLD_STYLE))
                 create_diff_tree(
                     {k: _NOT_PROVIDED for k in v2},
                     v2,
@@ -126,17 +147,18 @@ def create_diff_tree(
                     skip_unchanged=skip_unchanged,
                 )
         elif isinstance(v1, list) and isinstance(v2, list):
-            node = tree.add(Text(key, style="bold"))
-            if v1 == v2:
+            if v1 is v2 or v1 == v2:
                 if not skip_unchanged:
-                    style = "dim" if dim_unchanged else get_value_style(v1)
+                    node = tree.add(Text(key, style=BOLD_STYLE))
+                    style = DIM_STYLE if dim_unchanged else get_value_style(v1)
                     for i, v in enumerate(v1):
                         node.add(create_value_text(f"[{i}]", v, style))
             else:
+                node = tree.add(Text(key, style=BOLD_STYLE))
                 node_1 = node.add(Text("Previous:", style=DIFF_STYLE_MAP["previous"]))
                 for i, v in enumerate(v1):
                     node_1.add(
-                        create_value_text(f"[{i}]", v, style=DIFF_STYLE_MAP["previous"])
+                        create_value_text(f"[{i}]", v, DIFF_STYLE_MAP["previous"])
                     )
                 node_2 = node.add(Text("Current:", style=DIFF_STYLE_MAP["current"]))
                 for i, v in enumerate(v2):
@@ -146,59 +168,87 @@ def create_diff_tree(
         else:
             if v1 == v2:
                 if not skip_unchanged:
-                    style = "dim" if dim_unchanged else get_value_style(v1)
+                    style = DIM_STYLE if dim_unchanged else get_value_style(v1)
                     tree.add(create_value_text(key, v1, style))
             elif v1 is _NOT_PROVIDED:
                 texts = [
                     (f"{key}: ", DIFF_STYLE_MAP["modified"]),
-                    (repr(v2), get_value_style(v2)),
+                    (f"{v2!r}", get_value_style(v2)),
                     (" (Assigned)", DIFF_STYLE_MAP["unchanged"]),
                 ]
                 node = tree.add(Text.assemble(*texts))
             else:
                 node = tree.add(Text(key, style=DIFF_STYLE_MAP["modified"]))
-                node.add(
-                    Text(f"Previous: {repr(v1)}", style=DIFF_STYLE_MAP["previous"])
-                )
-                node.add(Text(f"Current: {repr(v2)}", style=DIFF_STYLE_MAP["current"]))
+                node.add(Text(f"Previous: {v1!r}", style=DIFF_STYLE_MAP["previous"]))
+                node.add(Text(f"Current: {v2!r}", style=DIFF_STYLE_MAP["current"]))
 
     # Start with a new tree if none is provided
     if parent is None:
         parent = Tree("📦 Dictionary Comparison")
 
-    # All keys in both dictionaries
-    all_keys = sorted(set(d1.keys()) | set(d2.keys()))
+    # Nothing would be added for identical dictionaries, so skip walking them
+    if skip_unchanged and (d1 is d2 or d1 == d2):
+        return parent
 
-    for key in all_keys:
-        if key in d1 and key in d2:
+    # All keys in both dictionaries, in sorted order; each is looked up once per dictionary
+    missing = object()
+    for key in sorted(d1.keys() | d2.keys()):
+        v1 = d1.get(key, missing)
+        v2 = d2.get(key, missing)
+        if v1 is not missing and v2 is not missing:
             # Key exists in both dictionaries
-            compare_values(key, d1[key], d2[key], parent)
-        elif key in d1:
+            compare_values(key, v1, v2, parent)
+        elif v1 is not missing:
             # Key only in first dictionary
             node = parent.add(
                 Text(f"❌ {key} (removed)", style=DIFF_STYLE_MAP["removed"])
             )
-            value = d1[key]
-            if isinstance(value, dict):
-                add_dict_to_tree(value, node, style=DIFF_STYLE_MAP["removed"])
-            elif isinstance(value, list):
-                add_list_to_tree(value, node, style=DIFF_STYLE_MAP["removed"])
-            else:
-                node.add(create_value_text("value", value, DIFF_STYLE_MAP["removed"]))
+            add_value_to_tree(v1, node, DIFF_STYLE_MAP["removed"])
         else:
             # Key only in second dictionary
             node = parent.add(Text(f"✨ {key} (added)", style=DIFF_STYLE_MAP["added"]))
-            value = d2[key]
-            if isinstance(value, dict):
-                add_dict_to_tree(value, node, style=DIFF_STYLE_MAP["added"])
-            elif isinstance(value, list):
-                add_list_to_tree(value, node, style=DIFF_STYLE_MAP["added"])
-            else:
-                node.add(create_value_text("value", value, DIFF_STYLE_MAP["added"]))
+            add_value_to_tree(v2, node, DIFF_STYLE_MAP["added"])
 
     return parent
 
 
+@functools.lru_cache(maxsize=4)
+def _legend_panel(dim_unchanged: bool, skip_unchanged: bool) -> Panel:
+    """Builds the legend shown next to the diff tree. Shared between calls, so never mutated."""
+    legend_items = [
+        ("Legend\n\n", "bold"),
+        ("✨ ", DIFF_STYLE_MAP["added"]),
+        ("Added in current\n", "default"),
+        ("❌ ", DIFF_STYLE_MAP["removed"]),
+        ("Removed from previous\n", "default"),
+        # ("Yellow", DIFF_STYLE_MAP["unchanged"]),
+        ("Modified keys\n", DIFF_STYLE_MAP["modified"]),
+        ("Red", "red"),
+        (" Previous values\n", "default"),
+        ("Blue", "blue"),
+        (" Current values\n\n", "default"),
+        ("Values:\n", "bold"),
+        ("Strings", TYPE_STYLE_MAP[str]),
+        (" / ", "default"),
+        ("Numbers", TYPE_STYLE_MAP[(int, float)]),
+        (" / ", "default"),
+        ("Booleans", TYPE_STYLE_MAP[bool]),
+        (" / ", "default"),
+        ("None", NONE_STYLE),
+    ]
+
+    if not skip_unchanged:
+        legend_style = "dim" if dim_unchanged else "default"
+        legend_items.insert(6, ("Unchanged", legend_style))
+        legend_items.insert(7, (" values\n", "default"))
+
+    return Panel(
+        Text.assemble(*legend_items),
+        title="Guide",
+        border_style="bright_blue",
+    )
+
+
 def print_tree_diff(
     dict1: dict[str, Any],
     dict2: dict[str, Any],
@@ -234,39 +284,7 @@ def print_tree_diff(
         skip_unchanged=skip_unchanged,
     )
 
-    # Create a legend panel
-    legend_items = [
-        ("Legend\n\n", "bold"),
-        ("✨ ", DIFF_STYLE_MAP["added"]),
-        ("Added in current\n", "default"),
-        ("❌ ", DIFF_STYLE_MAP["removed"]),
-        ("Removed from previous\n", "default"),
-        # ("Yellow", DIFF_STYLE_MAP["unchanged"]),
-        ("Modified keys\n", DIFF_STYLE_MAP["modified"]),
-        ("Red", "red"),
-        (" Previous values\n", "default"),
-        ("Blue", "blue"),
-        (" Current values\n\n", "default"),
-        ("Values:\n", "bold"),
-        ("Strings", TYPE_STYLE_MAP[str]),
-        (" / ", "default"),
-        ("Numbers", TYPE_STYLE_MAP[(int, float)]),
-        (" / ", "default"),
-        ("Booleans", TYPE_STYLE_MAP[bool]),
-        (" / ", "default"),
-        ("None", NONE_STYLE),
-    ]
-
-    if not skip_unchanged:
-        legend_style = "dim" if dim_unchanged else "default"
-        legend_items.insert(6, ("Unchanged", legend_style))
-        legend_items.insert(7, (" values\n", "default"))
-
-    legend = Panel(
-        Text.assemble(*legend_items),
-        title="Guide",
-        border_style="bright_blue",
-    )
+    legend = _legend_panel(dim_unchanged, skip_unchanged)
 
     # Print everything
     console.print("\n")
@@ -13,93 +13,96 @@ from rich.columns import Columns
 from .utils import format_type
 from .. import utils
 
+_BLANK_ROW_3 = (None, None, None)
+_BLANK_ROW_4 = (None, None, None, None)
+
+
+def _create_field_row(
+    key: str,
+    field: FieldInfo,
+    required: bool,
+    sep: str,
+    skip_parent_key: bool,
+    has_desc: bool,
+) -> list:
+    # Style field name based on required status
+    name_style = "bold magenta" if required else "magenta"
+    if skip_parent_key:
+        keys = key.split(sep)
+        key_str = (
+            "  " * (len(keys) - 1) + "." + keys[-1] if len(keys) > 1 else "--" + key
+        )
+    else:
+        key_str = "--" + key
+    field_name = Text(key_str, style=name_style)
+
+    # Style type
+    annotation = field.annotation
+    type_text = format_type(annotation)
+
+    # Format status
+    if utils.is_base_model(annotation):
+        status = ""
+    else:
+        if required:
+            status = Text("Required", style="yellow bold")
+        else:
+            default = field.get_default(call_default_factory=True)
+            status = Text(f"{default}", style="yellow")
+
+    rows = [field_name, status, type_text]
+    if has_desc:
+        rows.append(field.description)
+    return rows
+
 
 def create_aligned_tree_and_table(
     title: str, fields: dict[str, FieldInfo], sep=".", skip_parent_key: bool = False
 ) -> tuple[Tree, Table]:
     """Create a tree and table with aligned rows."""
-    # Create tree
+    has_desc = any(f.description for f in fields.values())
+
+    # Create table with proper spacing
+    table = Table(show_header=True, box=None, padding=(0, 1), collapse_padding=True)
+    table.add_column("Field", style="magenta")
+    table.add_column("Default", style="yellow")
+    table.add_column("Type", max_width=30 if has_desc else 60, no_wrap=True)
+    if has_desc:
+        table.add_column(
+            "Description", style="white", max_width=30 if has_desc else 60, no_wrap=True
+        )
+    blank_row = _BLANK_ROW_4 if has_desc else _BLANK_ROW_3
+
+    # Create tree, adding the table row of every tree line as it is created so both stay aligned
     root = Tree("")
     field_map = {}  # Map of paths to tree nodes
 
-    # First pass: create tree structure and track line numbers
-    line_to_field: dict[int, tuple[str, FieldInfo]] = (
-        {}
-    )  # Track which field appears on which line
-    current_line = 0
-
     for key, field in fields.items():
         parts = key.split(sep)
         current = root
+        required = field.is_required()
+        style = "yellow" if required else "bright white"
 
         for i, part in enumerate(parts):
             path = ".".join(parts[: i + 1])
             if path not in field_map:
-                style = "yellow" if field.is_required() else "bright white"
                 if i == len(parts) - 1:  # Leaf node
                     label = Text(f"{part}", style=style)
-                    line_to_field[current_line] = (key, field)
+                    table.add_row(
+                        *_create_field_row(
+                            key, field, required, sep, skip_parent_key, has_desc
+                        )
+                    )
                 else:
                     label = Text(part, style=style)
-                    current_line += 1  # Add empty line for guide lines
+                    # Empty rows for the guide line and the node itself
+                    table.add_row(*blank_row)
+                    table.add_row(*blank_row)
 
                 node = current.add(label)
                 field_map[path] = node
-                current_line += 1
             current = field_map[path]
 
-    has_desc = any(f.description for f in fields.values())
-
-    # Create table with proper spacing
-    table = Table(show_header=True, box=None, padding=(0, 1), collapse_padding=True)
-    table.add_column("Field", style="magenta")
-    table.add_column("Default", style="yellow")
-    table.add_column("Type", max_width=30 if has_desc else 60, no_wrap=True)
-    if has_desc:
-        table.add_column(
-            "Description", style="white", max_width=30 if has_desc else 60, no_wrap=True
-        )
-
-    # Second pass: add aligned table rows
-    for line in range(current_line):
-        if line in line_to_field:
-            key, field = line_to_field[line]
-            # Style field name based on required status
-            name_style = "bold magenta" if field.is_required else "magenta"
-            if skip_parent_key:
-                keys = key.split(sep)
-                key_str = (
-                    "  " * (len(keys) - 1) + "." + keys[-1]
-                    if len(keys) > 1
-                    else "--" + key
-                )
-            else:
-                key_str = "--" + key
-            field_name = Text(key_str, style=name_style)
-
-            # Style type
-            type_text = format_type(field.annotation)
-
-            # Format status
-            if utils.is_base_model(field.annotation):
-                status = ""
-            else:
-                if field.is_required():
-                    status = Text("Required", style="yellow bold")
-                else:
-                    status = Text(f"{field.default}", style="yellow")
-
-            rows = [field_name, status, type_text]
-            if has_desc:
-                rows.append(field.description)
-
-            # Add row with field information
-            table.add_row(*rows)
-        else:
-            # Add empty row to maintain alignment
-            rows = [None] * 4 if has_desc else 3
-            table.add_row(*rows)
-
     return Group(Text(title, style="bold"), *root.children), table
 
 
@@ -153,7 +156,7 @@ def print_help(
         model_class, sep=sep, underscore_to_hyphen=underscore_to_hyphen
     )
     tree, table = create_aligned_tree_and_table(
-        model_class.__name__, fields, skip_parent_key=skip_parent_key
+        model_class.__name__, fields, sep=sep, skip_parent_key=skip_parent_key
     )
 
     # Create panels
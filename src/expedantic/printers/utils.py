@@ -4,44 +4,56 @@ from types import NoneType, UnionType
 from rich.text import Text
 
 
-def format_type(annotation: Any) -> Text:
-    """Format type annotation into styled text."""
-    text = Text()
+def _type_name(tp: Any) -> str:
+    return tp.__name__ if hasattr(tp, "__name__") else str(tp)
+
 
+def _format_type_spans(annotation: Any) -> tuple[tuple[str, str | None], ...]:
+    """Styled `(text, style)` spans making up the formatted annotation."""
     # Handle Union/Optional types
     origin = get_origin(annotation)
     if origin in (UnionType, Union):
-        args = get_args(annotation)
-        for i, arg in enumerate(args):
+        spans = []
+        for i, arg in enumerate(get_args(annotation)):
             if i > 0:
-                text.append(" | ", style="bold")
-            text.append(
-                (
-                    "None"
-                    if arg is NoneType
-                    else arg.__name__ if hasattr(arg, "__name__") else str(arg)
-                ),
-                style="blue",
-            )
-        return text
+                spans.append((" | ", "bold"))
+            spans.append(("None" if arg is NoneType else _type_name(arg), "blue"))
+        return tuple(spans)
 
     # Handle other generic types
     if origin is not None:
+        spans = []
         if origin is not Literal:
-            text.append(origin.__name__, style="blue")
+            spans.append((origin.__name__, "blue"))
         args = get_args(annotation)
         if args:
-            text.append("[")
+            spans.append(("[", None))
             for i, arg in enumerate(args):
                 if i > 0:
-                    text.append(", ")
-                text.append(
-                    arg.__name__ if hasattr(arg, "__name__") else str(arg), style="cyan"
-                )
-            text.append("]")
-        return text
-
-    return Text(
-        annotation.__name__ if hasattr(annotation, "__name__") else str(annotation),
-        style="blue",
-    )
+                    spans.append((", ", None))
+                spans.append((_type_name(arg), "cyan"))
+            spans.append(("]", None))
+        return tuple(spans)
+
+    return ((_type_name(annotation), "blue"),)
+
+
+# Keyed on the annotation's string form: unlike the annotation itself, it keeps the order of
+# union members apart (`int | str == str | int`) and is always hashable.
+_format_type_cache: dict[str, tuple[tuple[str, str | None], ...]] = {}
+
+
+def format_type(annotation: Any) -> Text:
+    """Format type annotation into styled text."""
+    key = str(annotation)
+    spans = _format_type_cache.get(key)
+    if spans is None:
+        if len(_format_type_cache) >= 256:
+            # Bounded like the `lru_cache`s elsewhere; the oldest entry goes first.
+            del _format_type_cache[next(iter(_format_type_cache))]
+        spans = _format_type_cache[key] = _format_type_spans(annotation)
+
+    text = Text()
+    for span, style in spans:
+        text.append(span, style=style)
+    return text
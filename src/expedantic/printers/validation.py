@@ -1,5 +1,3 @@
-from itertools import groupby
-from operator import itemgetter
 from typing import Type, TypedDict
 
 from pydantic import BaseModel, ValidationError
@@ -96,8 +94,14 @@ def create_table(
     error_type: str,
     table_config: TableConfig,
 ):
-    contexts = [get_field_context(error["loc"], field_infos) for error in errors]
-    has_context = any(c[0] for c in contexts)
+    # Contexts are collected up front since they decide whether the column exists
+    contexts = []
+    has_context = False
+    for error in errors:
+        context = get_field_context(error["loc"], field_infos)
+        has_context = has_context or bool(context[0])
+        contexts.append(context)
+
     node = main_tree.add(f"[{table_config['colour']}]{format_error_type(error_type)}")
     table = Table(box=box.ROUNDED, show_header=True)
     table.add_column("Field", style=f"bold {table_config['colour']}")
@@ -107,9 +111,8 @@ def create_table(
     if has_context:
         table.add_column("Context", style="dim")
 
-    for i, error in enumerate(errors):
+    for error, (context, field_info) in zip(errors, contexts):
         field_path = ".".join(str(x) for x in error["loc"])
-        context, field_info = contexts[i]
         type_ = format_type(field_info.annotation) if field_info is not None else "?"
         row = [field_path, type_]
         if table_config["include_msg"]:
@@ -137,13 +140,10 @@ def print_validation_errors(
     console = console or Console()
     errors = validation_error.errors()
 
-    # Group errors by type
-    errors_by_type = {
-        k: list(g)
-        for k, g in groupby(
-            sorted(errors, key=itemgetter("type")), key=itemgetter("type")
-        )
-    }
+    # Group errors by type in a single pass, keeping their order within each type
+    errors_by_type: dict[str, list[ErrorDetails]] = {}
+    for error in errors:
+        errors_by_type.setdefault(error["type"], []).append(error)
 
     main_tree = Tree(f"[bold red]Validation Errors for {model_cls.__name__}")
 
@@ -163,9 +163,7 @@ def print_validation_errors(
 
     # Handle other types of errors
     other_errors = {
-        k: v
-        for k, v in errors_by_type.items()
-        if k not in ["missing", "type_error", "value_error"]
+        k: errors_by_type[k] for k in sorted(errors_by_type) if k not in errors_map
     }
     if other_errors:
         other_node = main_tree.add("[blue]Other Validation Errors")
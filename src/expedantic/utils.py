@@ -1,14 +1,54 @@
 import argparse
+import functools
 import inspect
+import sys
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any, Type, get_origin, get_args, Sequence
 
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
-from tap.utils import type_to_str, get_literals
 
 
 EMPTY = inspect.Parameter.empty
 POS_ONLY = inspect.Parameter.POSITIONAL_ONLY
+PRIMITIVES = (str, int, float, bool)
+
+
+# Literal types are hashable, so the parsed choices and caster are shared between every parser
+# built for the same field.
+@functools.lru_cache(maxsize=256)
+def get_literals(literal: Any, variable: str) -> tuple[Callable[[str], Any], list[Any]]:
+    """
+    Returns a caster from command-line strings to the values of the Literal type `literal`,
+    along with those values. Only primitive-typed values with distinct string forms are
+    supported.
+    """
+    literals = list(get_args(literal))
+
+    if not all(isinstance(value, PRIMITIVES) for value in literals):
+        raise argparse.ArgumentTypeError(
+            f'The type for variable "{variable}" contains a literal '
+            f"of a non-primitive type e.g. (str, int, float, bool).\n"
+            f"Currently only primitive-typed literals are supported."
+        )
+
+    str_to_literal = {str(value): value for value in literals}
+
+    if len(literals) != len(str_to_literal):
+        raise argparse.ArgumentTypeError(
+            "All literals must have unique string representations"
+        )
+
+    def var_type(arg: str) -> Any:
+        if arg not in str_to_literal:
+            raise argparse.ArgumentTypeError(
+                f'Value for variable "{variable}" must be one of {literals}.'
+            )
+
+        return str_to_literal[arg]
+
+    return var_type, literals
 
 
 class NOT_PROVIDED_CLASS:
@@ -19,7 +59,7 @@ class NOT_PROVIDED_CLASS:
 _NOT_PROVIDED = NOT_PROVIDED_CLASS()
 
 
-def get_kwargs(cls: Type):
+def _signature_kwargs(cls: Type | Callable) -> MappingProxyType:
     signature = inspect.signature(cls)
     kw_args = {
         k: (
@@ -27,20 +67,58 @@ def get_kwargs(cls: Type):
             v.default if v.default != EMPTY else ...,
         )
         for k, v in signature.parameters.items()
-        if v.kind != POS_ONLY
+        if v.kind is not POS_ONLY
     }
-    return kw_args
+    return MappingProxyType(kw_args)
+
+
+_cached_signature_kwargs = functools.lru_cache(maxsize=256)(_signature_kwargs)
+
+
+def get_kwargs(cls: Type | Callable) -> Mapping[str, tuple[Any, Any]]:
+    """
+    Returns a read-only mapping from keyword argument names of `cls` to their
+    `(annotation, default)` pairs. Results are memoized per callable since
+    `inspect.signature` is expensive; unhashable callables are inspected every time.
+    """
+    try:
+        return _cached_signature_kwargs(cls)
+    except TypeError:
+        return _signature_kwargs(cls)
 
 
 def flatten_dict(d: dict[str, Any], parent_key="", sep=".") -> dict[str, Any]:
-    items = []
-    for k, v in d.items():
-        new_key = parent_key + sep + k if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, parent_key=new_key, sep=sep).items())
+    result: dict[str, Any] = {}
+    # Depth-first walk over an explicit stack of item iterators keeps the original key order
+    # without recursing or building an intermediate dict per nesting level.
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((new_key, iter(v.items())))
+                break
+            result[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    return result
+
+
+def merge_dicts_in_place(dst: dict[str, Any], src: dict[str, Any]) -> dict[str, Any]:
+    """
+    Deep-merge `src` into `dst`, mutating and returning `dst`. Nested dictionaries present on
+    both sides are merged; any other value from `src` replaces the one in `dst`.
+    """
+    stack = [(dst, src)]
+    while stack:
+        d, s = stack.pop()
+        for k, v in s.items():
+            if isinstance(v, dict) and isinstance(d.get(k), dict):
+                stack.append((d[k], v))
+            else:
+                d[k] = v
+    return dst
 
 
 def get_default_dict(model: type[BaseModel], not_provided_value=None):
@@ -52,6 +130,11 @@ def get_default_dict(model: type[BaseModel], not_provided_value=None):
                 value = get_default_dict(tp, not_provided_value)
             else:
                 value = not_provided_value
+        elif field_info.default_factory is None and isinstance(
+            field_info.default, BaseModel
+        ):
+            # Only the model's type is used, so skip the deep copy `get_default` would make
+            value = get_default_dict(type(field_info.default), not_provided_value)
         else:
             value = field_info.get_default(call_default_factory=True)
             if isinstance(value, BaseModel):
@@ -95,7 +178,16 @@ def get_field_info(
         #     'address.street': FieldInfo(...),
         #     'address.city': FieldInfo(...)
         # }
+
+    Results are memoized per arguments; the returned dictionary is a fresh copy.
     """
+    return dict(_field_info_items(model_cls, prefix, sep, underscore_to_hyphen))
+
+
+@functools.lru_cache(maxsize=256)
+def _field_info_items(
+    model_cls: Type[BaseModel], prefix: str, sep: str, underscore_to_hyphen: bool
+) -> tuple[tuple[str, FieldInfo], ...]:
     result = {}
 
     # Get model's field definitions
@@ -106,7 +198,8 @@ def get_field_info(
             field_name = field_name.replace("_", "-")
 
         # Build the full field path
-        full_path = f"{prefix}{field_name}" if prefix else field_name
+        # Interned, as the cached paths are used as keys by every help and error rendering
+        full_path = sys.intern(f"{prefix}{field_name}")
 
         # Add the current field's FieldInfo
         result[full_path] = field
@@ -132,16 +225,28 @@ def get_field_info(
 
         # Recursively process nested BaseModels
         if isinstance(field_type, type) and issubclass(field_type, BaseModel):
-            nested_fields = get_field_info(field_type, prefix=f"{full_path}{sep}")
+            nested_fields = _field_info_items(
+                field_type, f"{full_path}{sep}", sep, underscore_to_hyphen
+            )
             result.update(nested_fields)
 
-    return result
+    return tuple(result.items())
 
 
-def is_base_model(tp):
+def _is_base_model(tp) -> bool:
     return isinstance(tp, type) and not get_origin(tp) and issubclass(tp, BaseModel)
 
 
+_cached_is_base_model = functools.lru_cache(maxsize=1024)(_is_base_model)
+
+
+def is_base_model(tp) -> bool:
+    try:
+        return _cached_is_base_model(tp)
+    except TypeError:
+        return _is_base_model(tp)
+
+
 class ArgumentParser(argparse.ArgumentParser):
     def _get_value(self, action, arg_string):
         try:
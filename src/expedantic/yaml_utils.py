@@ -1,15 +1,101 @@
-from ruamel.yaml import YAML as RUAMEL_YAML
-from ccorp.ruamel.yaml.include import YAML
-import pydantic_yaml
+import copy
+from pathlib import Path
+from typing import Any
 
-pydantic_yaml._internals.v2.YAML = YAML
 
-yaml = YAML()
-yaml.sort_base_mapping_type_on_output = False
-yaml.default_flow_style = False
-yaml.indent(mapping=2, sequence=4, offset=2)
+# ruamel and the `!include` extension are only imported, and the YAML objects below only built,
+# on first access through the module `__getattr__` (PEP 562). Runs that never touch a YAML file,
+# such as `--help` or plain command-line parsing, skip that setup.
 
-yaml.representer.add_representer(
-    type(None),
-    lambda self, _: self.represent_scalar("tag:yaml.org,2002:null", "null"),
-)
+
+def _import_ruamel_yaml():
+    from ruamel.yaml import YAML as RUAMEL_YAML
+
+    return RUAMEL_YAML
+
+
+def _import_include_yaml():
+    from ccorp.ruamel.yaml.include import YAML as IncludeYAML
+
+    class YAML(IncludeYAML):
+        def fork(self):
+            # Nested `!include`s are loaded by a fork of the loader. ruamel keeps `typ` as a
+            # list, which the extension's constructor rejects, so pass the plain name back.
+            typ = self.typ[0] if isinstance(self.typ, list) else self.typ
+            yaml = type(self)(typ=typ, pure=self.pure)
+            yaml.composer.anchors = self.composer.anchors
+            return yaml
+
+    return YAML
+
+
+def _build_yaml():
+    yaml = _lazy("YAML")()
+    yaml.sort_base_mapping_type_on_output = False
+    yaml.default_flow_style = False
+    yaml.indent(mapping=2, sequence=4, offset=2)
+
+    yaml.representer.add_representer(
+        type(None),
+        lambda self, _: self.represent_scalar("tag:yaml.org,2002:null", "null"),
+    )
+    return yaml
+
+
+def _build_safe_yaml():
+    # Safe loader backed by ruamel's C (libyaml) parser. The `!include`-aware `yaml` only works
+    # with the pure-Python parser, so this one is used whenever no include directive is present.
+    # Comments and anchors are not preserved, which is irrelevant for config ingestion.
+    return _lazy("RUAMEL_YAML")(typ="safe")
+
+
+_LAZY_ATTRIBUTES = {
+    "RUAMEL_YAML": _import_ruamel_yaml,
+    "YAML": _import_include_yaml,
+    "yaml": _build_yaml,
+    "safe_yaml": _build_safe_yaml,
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        factory = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = factory()
+    return value
+
+
+def _lazy(name: str) -> Any:
+    # Module globals are looked up without going through `__getattr__`.
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
+# Parsed documents of include-free files, keyed by resolved path and validated against the
+# file's modification time and size.
+_file_cache: dict[Path, tuple[tuple[int, int], Any]] = {}
+
+
+def load_yaml_file(path: Path | str) -> Any:
+    path = Path(path)
+    stat = path.stat()
+    key, version = path.resolve(), (stat.st_mtime_ns, stat.st_size)
+    cached = _file_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return copy.deepcopy(cached[1])
+
+    content = path.read_bytes()
+    if b"!include" in content:
+        # Includes are resolved relative to the stream's name, so load from the file itself.
+        # Not cached, as changes to the included files would go unnoticed.
+        with path.open("r") as f:
+            return _lazy("yaml").load(f)
+
+    data = _lazy("safe_yaml").load(content)
+    _file_cache[key] = (version, data)
+    # Callers may mutate the result (e.g. when merging CLI overrides), so never hand out the
+    # cached object itself.
+    return copy.deepcopy(data)
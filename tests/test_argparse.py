@@ -1,8 +1,13 @@
 import unittest
 import argparse
+import contextlib
+import io
+import tempfile
+from pathlib import Path
 from typing import Any
 
 from expedantic import ConfigBase
+from expedantic.config_base import _build_parser
 
 
 class Config(ConfigBase):
@@ -33,3 +38,121 @@ class TestArgParse(unittest.TestCase):
     def test_parse_dict(self):
         config = Config.parse_args(args=["--my_dict", "{key: value}"])
         self.assertEqual(config.my_dict.get("key"), "value")
+
+    def test_parser_is_reused(self):
+        parser, _ = _build_parser(Config, False, False, ".")
+        self.assertIs(_build_parser(Config, False, False, ".")[0], parser)
+
+        self.assertEqual(Config.parse_args(args=["--optional", "3"]).optional, 3)
+        self.assertEqual(Config.parse_args(args=["--optional", "4"]).optional, 4)
+
+        config = Config.parse_args(args=[])
+        self.assertEqual(config.optional, 1)
+        self.assertEqual(config.numbers, [1, 2, 3])
+
+    def test_defaults_are_not_shared(self):
+        first = Config.parse_args(args=[], diff_print_mode="none", print_config=False)
+        second = Config.parse_args(args=[], diff_print_mode="none", print_config=False)
+        first.my_dict["key"] = "value"
+        first.numbers.append(4)
+        self.assertEqual(second.my_dict, {})
+        self.assertEqual(second.numbers, [1, 2, 3])
+
+    def test_defaults_are_validated(self):
+        class Paths(ConfigBase):
+            class Inner(ConfigBase):
+                ratio: float = 1
+
+            path: Path = "./x"
+            scale: float = 1
+            inner: Inner = Inner()
+
+        for parse in (Paths.parse_args, Paths.fast_parse_args):
+            with self.subTest(parse=parse.__name__):
+                config = parse(args=[], diff_print_mode="none", print_config=False)
+                self.assertIsInstance(config.path, Path)
+                self.assertIsInstance(config.scale, float)
+                self.assertIsInstance(config.inner.ratio, float)
+
+    def test_default_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "config.yaml"
+            path.write_text("inner:\n  name: File\nmy_dict:\n  a: 1\n")
+            config = Config.parse_args(
+                args=[
+                    str(path),
+                    "--inner.favourite_number",
+                    "7",
+                    "--my_dict",
+                    "{b: 2}",
+                ],
+                require_default_file=True,
+                diff_print_mode="none",
+                print_config=False,
+            )
+        self.assertEqual(config.inner.name, "File")
+        self.assertEqual(config.inner.favourite_number, 7)
+        self.assertEqual(config.my_dict, {"a": 1, "b": 2})
+
+
+class TestFastParseArgs(unittest.TestCase):
+    def test_fast_parse_args(self):
+        config = Config.fast_parse_args(
+            args=["--optional", "3", "--numbers", "5", "6", "7"],
+            diff_print_mode="none",
+            print_config=False,
+        )
+        self.assertEqual(config.optional, 3)
+        self.assertEqual(config.numbers, [5, 6, 7])
+
+        config = Config.fast_parse_args(
+            args=["--inner.name=Test", "--inner.favourite_number", "7"],
+            diff_print_mode="none",
+            print_config=False,
+        )
+        self.assertEqual(config.inner.name, "Test")
+        self.assertEqual(config.inner.favourite_number, 7)
+
+        config = Config.fast_parse_args(
+            args=["--my_dict", "{key: value}"],
+            diff_print_mode="none",
+            print_config=False,
+        )
+        self.assertEqual(config.my_dict.get("key"), "value")
+
+    def test_matches_parse_args(self):
+        args = ["--numbers", "--optional", "-2", "--inner.favourite_number", "2.5"]
+        kwargs = dict(args=args, diff_print_mode="none", print_config=False)
+        self.assertEqual(Config.fast_parse_args(**kwargs), Config.parse_args(**kwargs))
+
+    def test_abbreviations(self):
+        args = ["--opt", "3", "--inner.fav=2.5", "--num", "4"]
+        kwargs = dict(args=args, diff_print_mode="none", print_config=False)
+        config = Config.fast_parse_args(**kwargs)
+        self.assertEqual(config, Config.parse_args(**kwargs))
+        self.assertEqual(config.optional, 3)
+        self.assertEqual(config.inner.favourite_number, 2.5)
+        self.assertEqual(config.numbers, [4])
+
+    def test_errors(self):
+        class Flags(ConfigBase):
+            verbose: bool = False
+
+        cases = [
+            (Config, ["stray", "--optional", "3"], "unrecognized arguments: stray"),
+            (Config, ["--optional"], "argument --optional: expected one argument"),
+            (Config, ["--inner.", "x"], "ambiguous option: --inner. could match"),
+            (
+                Flags,
+                ["--verbose=false"],
+                "argument --verbose/--no-verbose: ignored explicit argument",
+            ),
+        ]
+        for cls, args, message in cases:
+            for parse in (cls.fast_parse_args, cls.parse_args):
+                with self.subTest(parse=parse.__name__, args=args):
+                    stderr = io.StringIO()
+                    with contextlib.redirect_stderr(stderr):
+                        with self.assertRaises(SystemExit):
+                            parse(args=args, diff_print_mode="none", print_config=False)
+                    self.assertIn(message, stderr.getvalue())
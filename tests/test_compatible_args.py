@@ -0,0 +1,52 @@
+import unittest
+
+from expedantic import ConfigBase
+
+
+class Config(ConfigBase):
+    class Optimiser(ConfigBase):
+        name: str = "adam"
+
+    device: str = "cpu"
+    learning_rate: float = 1.0e-3
+    num_epochs: int = 100
+    optimiser: Optimiser = Optimiser()
+
+
+def learn(device: str, learning_rate: float, /, num_epochs: int = 10):
+    ...
+
+
+def optimise(optimiser, num_epochs: int):
+    ...
+
+
+class Learner:
+    def __init__(self, device: str, learning_rate: float, num_epochs: int): ...
+
+
+class TestCompatibleArgs(unittest.TestCase):
+    def test_compatible_args(self):
+        config = Config()
+        self.assertEqual(
+            config.compatible_args(Learner),
+            {"device": "cpu", "learning_rate": 1.0e-3, "num_epochs": 100},
+        )
+        self.assertEqual(
+            config.compatible_args(Learner, "device"),
+            {"learning_rate": 1.0e-3, "num_epochs": 100},
+        )
+        # Positional-only parameters are not keyword-compatible.
+        self.assertEqual(config.compatible_args(learn), {"num_epochs": 100})
+
+    def test_deep(self):
+        config = Config()
+        args = config.compatible_args(optimise)
+        self.assertIs(args["optimiser"], config.optimiser)
+
+        args = config.compatible_args(optimise, deep=True)
+        self.assertEqual(args, {"num_epochs": 100, "optimiser": {"name": "adam"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
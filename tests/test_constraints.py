@@ -1,8 +1,6 @@
 import unittest
 
 from pydantic import ConfigDict, ValidationError
-from pydantic_yaml import parse_yaml_raw_as
-from ruamel.yaml import YAML
 
 from expedantic import ConfigBase, Field
 
@@ -17,25 +15,25 @@ class Config(ConfigBase):
 class ConstraintsTest(unittest.TestCase):
     def test_int_float(self):
         with self.assertRaises(ValidationError):
-            config = parse_yaml_raw_as(Config, "a: 1.5")
+            config = Config.model_validate({"a": 1.5})
 
     def test_gt(self):
         with self.assertRaises(ValidationError):
-            config = parse_yaml_raw_as(Config, "a: -1\nb: 0.9")
+            config = Config.model_validate({"a": -1, "b": 0.9})
 
     def test_lt(self):
         with self.assertRaises(ValidationError):
-            config = parse_yaml_raw_as(Config, "a: 1\nb: 1.0")
+            config = Config.model_validate({"a": 1, "b": 1.0})
 
     def test_le(self):
-        config = parse_yaml_raw_as(Config, "c: 1.0")
+        config = Config.model_validate({"c": 1.0})
         self.assertEqual(config.c, 1.0)
 
     def test_ge(self):
-        config = parse_yaml_raw_as(Config, "c: 0.0")
+        config = Config.model_validate({"c": 0.0})
         self.assertEqual(config.c, 0.0)
         with self.assertRaises(ValidationError):
-            config = parse_yaml_raw_as(Config, "c: -0.1")
+            config = Config.model_validate({"c": -0.1})
 
 
 if __name__ == "__main__":
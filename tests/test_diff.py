@@ -0,0 +1,71 @@
+import unittest
+
+import enum
+
+from expedantic.printers.diff import (
+    DEFAULT_STYLE,
+    TYPE_STYLE_MAP,
+    create_diff_tree,
+    get_value_style,
+)
+
+
+def labels(tree):
+    return [child.label.plain for child in tree.children]
+
+
+class TestDiff(unittest.TestCase):
+    def test_key_order(self):
+        tree = create_diff_tree({"b": 1, "a": 2, "c": 3}, {"c": 3, "d": 4, "a": 5})
+        self.assertEqual(labels(tree), ["a", "❌ b (removed)", "c: 3", "✨ d (added)"])
+
+    def test_modified_list(self):
+        tree = create_diff_tree({"xs": [1, 2]}, {"xs": [1, 2, 3]})
+        (node,) = tree.children
+        previous, current = node.children
+        self.assertEqual(labels(previous), ["[0]: 1", "[1]: 2"])
+        self.assertEqual(labels(current), ["[0]: 1", "[1]: 2", "[2]: 3"])
+
+    def test_unchanged_list(self):
+        xs = [1, 2]
+        tree = create_diff_tree({"xs": xs, "a": 1}, {"xs": xs, "a": 2})
+        self.assertEqual(labels(tree), ["a", "xs"])
+        self.assertEqual(labels(tree.children[1]), ["[0]: 1", "[1]: 2"])
+
+        tree = create_diff_tree(
+            {"xs": xs, "a": 1}, {"xs": [1, 2], "a": 2}, skip_unchanged=True
+        )
+        self.assertEqual(labels(tree), ["a"])
+
+    def test_skip_unchanged_subtree(self):
+        d1 = {"net": {"sizes": [64, 64], "act": "relu"}, "seed": 0}
+        d2 = {"net": {"sizes": [64, 64], "act": "relu"}, "seed": 1}
+        tree = create_diff_tree(d1, d2, skip_unchanged=True)
+        self.assertEqual(labels(tree), ["seed"])
+
+        tree = create_diff_tree(d1, d1, skip_unchanged=True)
+        self.assertEqual(labels(tree), [])
+
+    def test_removed_and_added(self):
+        tree = create_diff_tree(
+            {"net": {"sizes": [64, {"act": "relu"}], "bias": True}}, {"seed": 0}
+        )
+        removed, added = tree.children
+        self.assertEqual(labels(removed), ["sizes", "bias: True"])
+        sizes = removed.children[0]
+        self.assertEqual(labels(sizes), ["[0] 64", "[1]"])
+        self.assertEqual(labels(sizes.children[1]), ["act: 'relu'"])
+        self.assertEqual(labels(added), ["value: 0"])
+
+    def test_value_style(self):
+        class Mode(str, enum.Enum):
+            A = "a"
+
+        self.assertEqual(get_value_style(True), TYPE_STYLE_MAP[bool])
+        self.assertEqual(get_value_style(1.5), TYPE_STYLE_MAP[(int, float)])
+        self.assertEqual(get_value_style(Mode.A), TYPE_STYLE_MAP[str])
+        self.assertEqual(get_value_style(object()), DEFAULT_STYLE)
+
+
+if __name__ == "__main__":
+    unittest.main()
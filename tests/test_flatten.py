@@ -0,0 +1,84 @@
+import enum
+import unittest
+from typing import Annotated
+
+from pydantic import PlainSerializer, WrapSerializer
+
+from expedantic import ConfigBase, utils
+
+
+class Config(ConfigBase):
+    class Inner(ConfigBase):
+        class Deepest(ConfigBase):
+            value: int = 0
+
+        name: str = "Inner"
+        deepest: Deepest = Deepest()
+        ratio: float = 0.5
+
+    first: int = 1
+    inner: Inner = Inner()
+    last: str = "last"
+
+
+class TestFlatten(unittest.TestCase):
+    def test_flatten(self):
+        flat = Config().flatten()
+        self.assertEqual(
+            list(flat.items()),
+            [
+                ("first", 1),
+                ("inner.name", "Inner"),
+                ("inner.deepest.value", 0),
+                ("inner.ratio", 0.5),
+                ("last", "last"),
+            ],
+        )
+
+    def test_flatten_sep(self):
+        flat = Config().flatten(sep="/")
+        self.assertEqual(flat["inner/deepest/value"], 0)
+
+    def test_matches_model_dump(self):
+        class Mode(enum.Enum):
+            FAST = "fast"
+
+        class Other(ConfigBase):
+            inner: Config.Inner = Config.Inner()
+            maybe: Config.Inner | None = None
+            sizes: list[int] = [1, 2]
+            mapping: dict[str, int] = {"a": 1}
+            mode: Mode = Mode.FAST
+
+        configs = [
+            Config(),
+            Other(),
+            Other(maybe=Config.Inner(name="maybe"), mapping={}),
+        ]
+        for config in configs:
+            with self.subTest(config=config):
+                expected = utils.flatten_dict(config.model_dump())
+                self.assertEqual(list(config.flatten().items()), list(expected.items()))
+
+    def test_field_serializers(self):
+        class Scaled(ConfigBase):
+            x: Annotated[int, PlainSerializer(lambda v: v * 100)] = 2
+            y: Annotated[int, WrapSerializer(lambda v, handler: handler(v) + 1)] = 1
+
+        class Outer(ConfigBase):
+            scaled: Scaled = Scaled()
+
+        self.assertEqual(Scaled().flatten(), {"x": 200, "y": 2})
+        self.assertEqual(Outer().flatten(), {"scaled.x": 200, "scaled.y": 2})
+
+    def test_lists_are_copied(self):
+        class Sizes(ConfigBase):
+            sizes: list[int] = [64, 64]
+
+        config = Sizes()
+        config.flatten()["sizes"].append(128)
+        self.assertEqual(config.sizes, [64, 64])
+
+
+if __name__ == "__main__":
+    unittest.main()
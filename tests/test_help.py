@@ -0,0 +1,57 @@
+import unittest
+
+from rich.console import Console
+
+from expedantic import ConfigBase, Field
+from expedantic.printers.help import print_help
+from expedantic.printers.utils import format_type
+from expedantic.utils import get_field_info
+
+
+class Config(ConfigBase):
+    class Inner(ConfigBase):
+        class Deepest(ConfigBase):
+            max_value: int = 2
+
+        hidden_size: int = Field(64, description="Width of each hidden layer.")
+        deepest: Deepest = Deepest()
+
+    inner_net: Inner = Inner()
+    seed: int
+
+
+class TestHelp(unittest.TestCase):
+    def test_field_info(self):
+        fields = get_field_info(Config, sep="/", underscore_to_hyphen=True)
+        self.assertEqual(
+            list(fields),
+            [
+                "inner-net",
+                "inner-net/hidden-size",
+                "inner-net/deepest",
+                "inner-net/deepest/max-value",
+                "seed",
+            ],
+        )
+        self.assertIs(fields["seed"], Config.model_fields["seed"])
+
+        fields.clear()
+        self.assertEqual(len(get_field_info(Config)), 5)
+
+    def test_print_help(self):
+        console = Console(record=True, width=120)
+        print_help(Config, True, "/", console)
+        output = console.export_text()
+        self.assertIn("--inner-net/deepest/max-value", output)
+        self.assertIn("Width of each hidden layer.", output)
+        self.assertIn("Required", output)
+
+    def test_format_type(self):
+        self.assertEqual(format_type(int | None).plain, "int | None")
+        self.assertEqual(format_type(str | int).plain, "str | int")
+        self.assertEqual(format_type(int | str).plain, "int | str")
+        self.assertEqual(format_type(dict[str, int]).plain, "dict[str, int]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,19 +2,36 @@ import unittest
 from typing import Literal
 
 from pydantic import ValidationError
-from pydantic_yaml import parse_yaml_raw_as
+from ruamel.yaml import YAML
 
 from expedantic import ConfigBase
 
+# ruamel uses its libyaml-backed C parser here when available.
+yaml = YAML(typ="safe")
+
 
 class Config(ConfigBase):
     distribution: Literal["Gaussian", "Uniform", "Cauchy", "Poisson"]
 
 
+class CLIConfig(ConfigBase):
+    distribution: Literal["Gaussian", "Uniform"] = "Gaussian"
+    num_layers: Literal[1, 2, 3] = 1
+
+
 class TestLiteral(unittest.TestCase):
     def test_literal(self):
         with self.assertRaises(ValidationError):
-            config = parse_yaml_raw_as(Config, "distribution: Dirichlet")
+            config = Config.model_validate(yaml.load("distribution: Dirichlet"))
 
-        config = parse_yaml_raw_as(Config, "distribution: Gaussian")
+        config = Config.model_validate(yaml.load("distribution: Gaussian"))
         self.assertEqual(config.distribution, "Gaussian")
+
+    def test_parse_args(self):
+        config = CLIConfig.parse_args(
+            args=["--distribution", "Uniform", "--num_layers", "3"],
+            diff_print_mode="none",
+            print_config=False,
+        )
+        self.assertEqual(config.distribution, "Uniform")
+        self.assertEqual(config.num_layers, 3)
@@ -0,0 +1,28 @@
+import unittest
+
+from expedantic import ConfigBase
+
+
+class Config(ConfigBase):
+    class Inner(ConfigBase):
+        name: str = "Inner"
+
+    batch_size: int = 512
+    inner: Inner = Inner()
+
+
+class TestMapping(unittest.TestCase):
+    def test_mapping(self):
+        config = Config()
+        self.assertEqual(config["batch_size"], 512)
+        self.assertEqual(config["inner"]["name"], "Inner")
+        self.assertEqual(len(config), 2)
+        self.assertEqual(list(config.keys()), ["batch_size", "inner"])
+        self.assertEqual(list(config["inner"].keys()), ["name"])
+
+        with self.assertRaises(KeyError):
+            config["not_a_field"]
+
+
+if __name__ == "__main__":
+    unittest.main()
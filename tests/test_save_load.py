@@ -0,0 +1,74 @@
+import importlib.util
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+
+from expedantic import ConfigBase
+
+
+class Config(ConfigBase):
+    class Inner(ConfigBase):
+        name: str = "Inner"
+        sizes: list[int] = [64, 64]
+
+    device: str = "cpu"
+    learning_rate: float = 3.0e-4
+    inner: Inner = Inner()
+
+
+class TestSaveLoad(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "config.yaml"
+        self.config = Config(device="cuda", inner=Config.Inner(sizes=[128]))
+        self.config.save_as_yaml(self.path)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        config = Config.load_from_yaml(
+            self.path, diff_print_mode="none", print_config=False
+        )
+        self.assertEqual(config, self.config)
+
+    def test_reload_after_change(self):
+        kwargs = dict(diff_print_mode="none", print_config=False)
+        first = Config.load_from_yaml(self.path, **kwargs)
+        first.inner.sizes.append(256)
+        self.assertEqual(Config.load_from_yaml(self.path, **kwargs), self.config)
+
+        Config(device="cuda:1").save_as_yaml(self.path)
+        config = Config.load_from_yaml(self.path, **kwargs)
+        self.assertEqual(config.device, "cuda:1")
+        self.assertEqual(config.inner.sizes, [64, 64])
+
+    def test_trusted(self):
+        config = Config.load_from_yaml(
+            self.path, diff_print_mode="none", print_config=False, trusted=True
+        )
+        self.assertEqual(config, self.config)
+        self.assertIsInstance(config.inner, Config.Inner)
+        self.assertEqual(config.inner.sizes, [128])
+
+    def test_trusted_discriminated_union(self):
+        path = Path(__file__).parents[1] / "examples" / "discriminated_unions.py"
+        spec = importlib.util.spec_from_file_location("discriminated_unions", path)
+        example = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(example)
+
+        saved = example.Config(gan_config={"name": "WGAN", "n_critic_epochs": 3})
+        saved.save_as_yaml(self.path)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            config = example.Config.load_from_yaml(
+                self.path, print_config=False, trusted=True
+            )
+        self.assertEqual(config, saved)
+        self.assertIsInstance(config.gan_config, example.WGANConfig)
+        self.assertIsInstance(config.checkpoint_save_dir, Path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Literal
+
+from expedantic import ConfigBase, Field
+
+
+class Config(ConfigBase):
+    algorithm: Literal["TRPO", "PPO", "SAC", "TD3"] = "TRPO"
+    target_kl: float = Field(0.01, description="Should be small for stability.")
+
+
+class TestSchema(unittest.TestCase):
+    def test_generate_schema(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "schemas" / "config_schema.json"
+            Config.generate_schema(path)
+            Config.generate_schema(path)
+            schema = json.loads(path.read_text())
+
+        self.assertEqual(schema, Config.model_json_schema())
+        self.assertEqual(
+            schema["properties"]["target_kl"]["description"],
+            "Should be small for stability.",
+        )
+
+    def test_invalidate_schema_cache(self):
+        class Rebuilt(ConfigBase):
+            x: int = Field(1, description="old")
+
+        def generated_description():
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = Path(tmp_dir) / "schema.json"
+                Rebuilt.generate_schema(path)
+                return json.loads(path.read_text())["properties"]["x"]["description"]
+
+        self.assertEqual(generated_description(), "old")
+
+        Rebuilt.model_fields["x"].description = "new"
+        Rebuilt.model_rebuild(force=True)
+        self.assertEqual(generated_description(), "old")
+
+        ConfigBase.expedantic_invalidate_schema_cache()
+        self.assertEqual(generated_description(), "new")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from typing import Literal
+
+import pydantic
+from rich.console import Console
+
+from expedantic import ConfigBase, Field
+from expedantic.printers.validation import print_validation_errors
+
+
+class Config(ConfigBase):
+    class Inner(ConfigBase):
+        size: int
+        ratio: float = Field(1.0, gt=0, description="Must be positive.")
+
+    seed: int
+    mode: Literal["train", "eval"] = "train"
+    inner: Inner
+
+
+class TestValidationErrors(unittest.TestCase):
+    def test_print_validation_errors(self):
+        with self.assertRaises(pydantic.ValidationError) as cm:
+            Config.model_validate(
+                {"mode": "test", "inner": {"ratio": -1}, "unknown": 1}
+            )
+
+        console = Console(record=True, width=160)
+        print_validation_errors(Config, cm.exception, console)
+        output = console.export_text()
+
+        self.assertIn("Missing Required Values", output)
+        self.assertIn("inner.size", output)
+        self.assertIn("Other Validation Errors", output)
+        self.assertLess(output.index("extra_forbidden"), output.index("greater_than"))
+        self.assertLess(output.index("greater_than"), output.index("literal_error"))
+        self.assertIn("Input=1", output)
+        self.assertIn("Must be positive.", output)
+
+
+if __name__ == "__main__":
+    unittest.main()